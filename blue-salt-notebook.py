@@ -22,18 +22,39 @@ Convert to .ipynb format or copy cells into Jupyter.
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.ticker import FuncFormatter
 import seaborn as sns
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+# Also write the enhanced dataset as CSV for human inspection
+EXPORT_CSV = False
+
 # Set display options
 pd.set_option('display.max_columns', None)
 pd.set_option('display.max_rows', 100)
 
-# Set style
-plt.style.use('seaborn-v0_8-whitegrid')
-sns.set_palette("husl")
+# Set style; the stylesheet and palette are resolved once per kernel and
+# re-applied from the cached rcParams when this cell is re-run
+if '_STYLE_RC' not in globals():
+    plt.style.use('seaborn-v0_8-whitegrid')
+    sns.set_palette("husl")
+    _STYLE_RC = dict(plt.rcParams)
+
+def apply_style():
+    plt.rcParams.update(_STYLE_RC)
+
+apply_style()
+
+# Shared axis helpers: dollar amounts in thousands, rotated category labels
+K_FMT = FuncFormatter(lambda x, _: f'${x/1000:.0f}K')
+
+def rotate(ax, deg=45):
+    for t in ax.get_xticklabels():
+        t.set_rotation(deg)
 
 print("Libraries imported successfully!")
 print(f"Analysis date: {datetime.now().strftime('%Y-%m-%d')}")
@@ -42,8 +63,27 @@ print(f"Analysis date: {datetime.now().strftime('%Y-%m-%d')}")
 # ## 2. Load and Explore Data
 
 # %%
-# Load the cleaned data
-df = pd.read_csv('blue_salt_clean_data.csv')
+# Load the cleaned data; Parquet keeps the categorical and narrow integer
+# dtypes written by blue_salt_customer_analysis.py. It is read in one go:
+# the plots, medians and the enhanced export all need every row, so reading
+# in chunks would still end with the whole frame in memory.
+df = pd.read_parquet('blue_salt_clean_data.parquet')
+
+# Keep numeric columns narrow (matches the upstream export): age fits in
+# 8 bits and income in 32; means still come back as float64
+df = df.astype({'age': 'uint8', 'income': 'uint32'})
+
+# Pack the four 0/1 flag columns into one uint8 bitmask (bit i = FLAG_COLS[i])
+FLAG_COLS = ['has_price_concern', 'disappointed_visual', 'positive_taste', 'would_recommend_binary']
+df['flag_bits'] = np.packbits(df[FLAG_COLS].to_numpy(dtype=bool), axis=1, bitorder='little')[:, 0]
+df = df.drop(columns=FLAG_COLS)
+
+# Plain NumPy copies of the columns the summary reductions and segment masks
+# use; on a cohort this small, pandas' per-call dispatch costs more than the
+# arithmetic (missing labels stay NaN and never match in the masks)
+age = df['age'].to_numpy()
+income = df['income'].to_numpy(dtype=np.float64)
+jtbd = df['primary_jtbd'].to_numpy()
 
 print(f"Dataset shape: {df.shape}")
 print(f"\nColumns: {list(df.columns)}")
@@ -70,55 +110,91 @@ print(missing_data[missing_data > 0])
 # ## 3. Demographic Analysis
 
 # %%
+# All charts in the notebook share one figure; each section draws into its
+# own axes and the layout is solved once at the end of section 9. Closing it
+# detaches it from pyplot, so the inline backend doesn't show it half-drawn
+# when this cell ends; the bare `fig` at the end of section 9 displays it.
+apply_style()
+fig, axes = plt.subplots(5, 2, figsize=(14, 30))
+plt.close(fig)
+
+# Demographic summary statistics, reused below and in section 8
+age_mean = age.mean()
+income_mean = income.mean()
+income_med = np.median(income)
+
 # Age distribution
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+ax1, ax2 = axes[0]
 
 # Histogram
 ax1.hist(df['age'], bins=10, edgecolor='black', alpha=0.7)
 ax1.set_xlabel('Age')
 ax1.set_ylabel('Count')
 ax1.set_title('Age Distribution of Participants')
-ax1.axvline(df['age'].mean(), color='red', linestyle='--', label=f'Mean: {df["age"].mean():.1f}')
+ax1.axvline(age_mean, color='red', linestyle='--', label=f'Mean: {age_mean:.1f}')
 ax1.legend()
 
 # Box plot by gender
-df.boxplot(column='age', by='gender', ax=ax2)
+sns.boxplot(data=df, x='gender', y='age', ax=ax2)
 ax2.set_title('Age by Gender')
 ax2.set_xlabel('Gender')
 ax2.set_ylabel('Age')
 
-plt.tight_layout()
-plt.show()
-
 # %%
 # Income analysis
-print(f"Average income: ${df['income'].mean():,.0f}")
-print(f"Median income: ${df['income'].median():,.0f}")
+print(f"Average income: ${income_mean:,.0f}")
+print(f"Median income: ${income_med:,.0f}")
 print(f"\nIncome by gender:")
-print(df.groupby('gender')['income'].agg(['mean', 'median', 'count']))
+
+# mean/median/count per gender from one sort and two bincounts, instead of
+# a separate pass per statistic (and a sort per group for the median).
+# Missing genders factorize to -1 and are dropped, as groupby would.
+gender_codes, genders = pd.factorize(df['gender'], sort=True)
+valid = gender_codes >= 0
+gender_codes, gender_income = gender_codes[valid], income[valid]
+counts = np.bincount(gender_codes, minlength=len(genders))
+means = np.bincount(gender_codes, weights=gender_income, minlength=len(genders)) / counts
+sorted_income = gender_income[np.lexsort((gender_income, gender_codes))]
+starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+medians = (sorted_income[starts + (counts - 1) // 2] + sorted_income[starts + counts // 2]) / 2
+income_by_gender = pd.DataFrame(
+    {'mean': means, 'median': medians, 'count': counts},
+    index=pd.Index(genders, name='gender')
+)
+print(income_by_gender)
 
 # %% [markdown]
 # ## 4. Jobs to be Done Analysis
 
 # %%
 # JTBD distribution
-jtbd_counts = df['primary_jtbd'].value_counts()
-jtbd_pct = (jtbd_counts / len(df) * 100).round(1)
+# Counted once here; the percentages below and section 8 reuse this result
+# (bincount over the category codes; missing values are code -1 and skipped,
+# and the stable argsort keeps category order for ties, like value_counts)
+jtbd_codes = df['primary_jtbd'].cat.codes.to_numpy()
+jtbd_labels = df['primary_jtbd'].cat.categories
+jtbd_freq = np.bincount(jtbd_codes[jtbd_codes >= 0], minlength=len(jtbd_labels))
+order = np.argsort(-jtbd_freq, kind='stable')
+jtbd_counts = pd.Series(jtbd_freq[order], index=pd.Index(jtbd_labels[order], name='primary_jtbd'), name='count')
+jtbd_pct = (jtbd_counts / jtbd_counts.sum() * 100).round(1)
 
 # Create pie chart
-plt.figure(figsize=(10, 8))
+ax = axes[1, 0]
 colors = ['#667eea', '#764ba2', '#f093fb']
-plt.pie(jtbd_pct, labels=jtbd_pct.index, autopct='%1.1f%%', colors=colors, startangle=90)
-plt.title('Jobs to be Done Distribution', fontsize=16, fontweight='bold')
-plt.axis('equal')
-plt.show()
+ax.pie(jtbd_pct, labels=jtbd_pct.index, autopct='%1.1f%%', colors=colors, startangle=90)
+ax.set_title('Jobs to be Done Distribution', fontsize=16, fontweight='bold')
+ax.axis('equal')
 
 # %%
 # JTBD by demographics
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+ax1, ax2 = axes[1, 1], axes[2, 0]
 
 # By income bracket
-jtbd_income = pd.crosstab(df['income_bracket'], df['primary_jtbd'])
+jtbd_income = (
+    df.groupby(['income_bracket', 'primary_jtbd'], observed=True)
+    .size()
+    .unstack('primary_jtbd', fill_value=0)
+)
 jtbd_income.plot(kind='bar', ax=ax1, rot=0)
 ax1.set_title('JTBD by Income Bracket')
 ax1.set_xlabel('Income Bracket')
@@ -131,38 +207,35 @@ income_by_jtbd.plot(kind='bar', ax=ax2, color='#667eea')
 ax2.set_title('Average Income by JTBD')
 ax2.set_xlabel('Primary Job')
 ax2.set_ylabel('Average Income ($)')
-ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x/1000:.0f}K'))
-
-plt.tight_layout()
-plt.show()
+ax2.yaxis.set_major_formatter(K_FMT)
 
 # %% [markdown]
 # ## 5. Pain Points Analysis
 
 # %%
-# Calculate pain point percentages
+# Calculate pain point percentages; one unpack + sum counts every flag bit
+bits = np.unpackbits(df['flag_bits'].to_numpy()[:, None], axis=1, count=len(FLAG_COLS), bitorder='little')
+flag_sums = pd.Series(bits.sum(axis=0), index=FLAG_COLS)
+n = len(df)
 pain_points = {
-    'Price Concerns': (df['has_price_concern'].sum() / len(df) * 100),
-    'Visual Disappointment': (df['disappointed_visual'].sum() / len(df) * 100),
-    'Taste Uncertainty': ((~df['positive_taste']).sum() / len(df) * 100)
+    'Price Concerns': flag_sums['has_price_concern'] / n * 100,
+    'Visual Disappointment': flag_sums['disappointed_visual'] / n * 100,
+    'Taste Uncertainty': (n - flag_sums['positive_taste']) / n * 100
 }
 
 # Create horizontal bar chart
-plt.figure(figsize=(10, 6))
-pain_df = pd.DataFrame(list(pain_points.items()), columns=['Pain Point', 'Percentage'])
-bars = plt.barh(pain_df['Pain Point'], pain_df['Percentage'], color=['#e74c3c', '#e67e22', '#f39c12'])
+ax = axes[2, 1]
+bars = ax.barh(list(pain_points), list(pain_points.values()), color=['#e74c3c', '#e67e22', '#f39c12'])
 
 # Add percentage labels
 for i, bar in enumerate(bars):
     width = bar.get_width()
-    plt.text(width + 1, bar.get_y() + bar.get_height()/2, 
+    ax.text(width + 1, bar.get_y() + bar.get_height()/2, 
              f'{width:.0f}%', ha='left', va='center', fontweight='bold')
 
-plt.xlabel('Percentage of Customers (%)')
-plt.title('Customer Pain Points Analysis', fontsize=14, fontweight='bold')
-plt.xlim(0, 80)
-plt.tight_layout()
-plt.show()
+ax.set_xlabel('Percentage of Customers (%)')
+ax.set_title('Customer Pain Points Analysis', fontsize=14, fontweight='bold')
+ax.set_xlim(0, 80)
 
 # %% [markdown]
 # ## 6. Usage Patterns
@@ -171,14 +244,14 @@ plt.show()
 # Usage frequency analysis
 usage_dist = df['usage_category'].value_counts()
 
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+ax1, ax2 = axes[3]
 
 # Usage distribution
 usage_dist.plot(kind='bar', ax=ax1, color=['#2ecc71', '#3498db', '#9b59b6'])
 ax1.set_title('Usage Frequency Distribution')
 ax1.set_xlabel('Usage Category')
 ax1.set_ylabel('Number of Customers')
-ax1.set_xticklabels(ax1.get_xticklabels(), rotation=45)
+rotate(ax1)
 
 # Income by usage pattern
 usage_income = df.groupby('usage_category')['income'].mean()
@@ -186,81 +259,78 @@ usage_income.plot(kind='bar', ax=ax2, color=['#2ecc71', '#3498db', '#9b59b6'])
 ax2.set_title('Average Income by Usage Pattern')
 ax2.set_xlabel('Usage Category')
 ax2.set_ylabel('Average Income ($)')
-ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x/1000:.0f}K'))
-ax2.set_xticklabels(ax2.get_xticklabels(), rotation=45)
-
-plt.tight_layout()
-plt.show()
+ax2.yaxis.set_major_formatter(K_FMT)
+rotate(ax2)
 
 # %% [markdown]
 # ## 7. Customer Segmentation
 
 # %%
-# Create customer segments based on usage and income
-df['segment'] = 'Unknown'
-
-# High-value occasional users
-mask1 = (df['usage_category'] == 'occasional') & (df['income'] > 200000)
-df.loc[mask1, 'segment'] = 'Premium Gift Buyers'
-
-# Regular health-conscious users
-mask2 = (df['usage_category'].isin(['daily', 'weekly'])) & (df['primary_jtbd'] == 'healthy_meal')
-df.loc[mask2, 'segment'] = 'Health Enthusiasts'
-
-# Social users
-mask3 = df['primary_jtbd'] == 'social_bonding'
-df.loc[mask3, 'segment'] = 'Social Entertainers'
-
-# Others
-mask4 = df['segment'] == 'Unknown'
-df.loc[mask4, 'segment'] = 'General Users'
+# Create customer segments based on usage and income in a single pass.
+# np.select picks the first matching condition, so the most specific
+# segment is listed first (social users take precedence over the others).
+# The masks are built on plain arrays, so pandas is only touched once the
+# labels are attached.
+usage = df['usage_category'].to_numpy()
+conditions = [
+    # Social users
+    jtbd == 'social_bonding',
+    # Regular health-conscious users
+    np.isin(usage, ['daily', 'weekly']) & (jtbd == 'healthy_meal'),
+    # High-value occasional users
+    (usage == 'occasional') & (income > 200000)
+]
+choices = ['Social Entertainers', 'Health Enthusiasts', 'Premium Gift Buyers']
+df['segment'] = pd.Categorical(np.select(conditions, choices, default='General Users'))
 
 # Visualize segments
 segment_counts = df['segment'].value_counts()
 
-plt.figure(figsize=(10, 6))
-segment_counts.plot(kind='bar', color=['#e74c3c', '#3498db', '#2ecc71', '#f39c12'])
-plt.title('Customer Segments', fontsize=14, fontweight='bold')
-plt.xlabel('Segment')
-plt.ylabel('Count')
-plt.xticks(rotation=45)
+ax = axes[4, 0]
+segment_counts.plot(kind='bar', ax=ax, color=['#e74c3c', '#3498db', '#2ecc71', '#f39c12'])
+ax.set_title('Customer Segments', fontsize=14, fontweight='bold')
+ax.set_xlabel('Segment')
+ax.set_ylabel('Count')
+rotate(ax)
 
 # Add count labels
 for i, v in enumerate(segment_counts):
-    plt.text(i, v + 0.1, str(v), ha='center', fontweight='bold')
-
-plt.tight_layout()
-plt.show()
+    ax.text(i, v + 0.1, str(v), ha='center', fontweight='bold')
 
 # %% [markdown]
 # ## 8. Key Insights Summary
 
 # %%
+# Compute each reduction once; age_mean/income_mean, jtbd_counts and
+# flag_sums are reused from sections 3, 4 and 5
+n = len(df)
+recommend_pct = flag_sums['would_recommend_binary'] / n * 100
+price_pct = flag_sums['has_price_concern'] / n * 100
+visual_pct = flag_sums['disappointed_visual'] / n * 100
+
 # Create insights summary
 insights = {
-    'Total Participants': len(df),
-    'Average Age': f"{df['age'].mean():.1f} years",
-    'Average Income': f"${df['income'].mean():,.0f}",
-    'Would Recommend': f"{(df['would_recommend_binary'].sum()/len(df)*100):.0f}%",
-    'Price Concerns': f"{(df['has_price_concern'].sum()/len(df)*100):.0f}%",
-    'Visual Disappointment': f"{(df['disappointed_visual'].sum()/len(df)*100):.0f}%",
-    'Dominant JTBD': df['primary_jtbd'].value_counts().index[0],
-    'JTBD Concentration': f"{(df['primary_jtbd'].value_counts().iloc[0]/len(df)*100):.0f}%"
+    'Total Participants': n,
+    'Average Age': f"{age_mean:.1f} years",
+    'Average Income': f"${income_mean:,.0f}",
+    'Would Recommend': f"{recommend_pct:.0f}%",
+    'Price Concerns': f"{price_pct:.0f}%",
+    'Visual Disappointment': f"{visual_pct:.0f}%",
+    'Dominant JTBD': jtbd_counts.index[0],
+    'JTBD Concentration': f"{jtbd_pct.iloc[0]:.0f}%"
 }
 
 # Display as formatted table
-insights_df = pd.DataFrame(list(insights.items()), columns=['Metric', 'Value'])
 print("KEY INSIGHTS SUMMARY")
 print("="*40)
-for _, row in insights_df.iterrows():
-    print(f"{row['Metric']:<25} {row['Value']}")
+print("\n".join(f"{k:<25} {v}" for k, v in insights.items()))
 
 # %% [markdown]
 # ## 9. Strategic Recommendations
 
 # %%
 # Visual representation of strategic pivot
-fig, ax = plt.subplots(figsize=(12, 8))
+ax = axes[4, 1]
 
 # Create visual framework
 categories = ['Positioning', 'Target', 'Price', 'Value Prop']
@@ -286,8 +356,9 @@ ax.legend()
 ax.set_ylim(0, 1.5)
 ax.set_yticks([])
 
-plt.tight_layout()
-plt.show()
+# Lay out every panel once and display the combined figure
+fig.tight_layout()
+fig
 
 # %% [markdown]
 # ## 10. Next Steps
@@ -311,5 +382,7 @@ plt.show()
 
 # %%
 # Save enhanced dataset
-df.to_csv('blue_salt_enhanced_analysis.csv', index=False)
+df.to_parquet('blue_salt_enhanced_analysis.parquet', compression='zstd')
+if EXPORT_CSV:
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), 'blue_salt_enhanced_analysis.csv')
 print("Enhanced dataset saved successfully!")
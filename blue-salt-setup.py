@@ -8,119 +8,151 @@ Run this first to set up all directories and files.
 
 import os
 import shutil
+from pathlib import Path
+
+# Project directories; parents are listed for readability but only the
+# leaves are passed to mkdir (parents=True creates the rest)
+DIRECTORIES = [
+    'data',
+    'data/raw',
+    'data/raw/transcripts',
+    'data/processed',
+    'outputs',
+    'outputs/visualizations',
+    'outputs/reports',
+    'notebooks',
+    'scripts',
+    'config',
+    'tests',
+    'docs'
+]
+
+DATA_README = """# Data Directory
+
+This directory contains all data files for the Blue Salt analysis.
+
+## Structure
+- `raw/` - Original interview data and transcripts
+- `processed/` - Cleaned and processed data files
+
+## Privacy Note
+All participant data is anonymized. Raw transcripts are not tracked in git.
+"""
+
+OUTPUTS_README = """# Output Directory
+
+This directory contains all analysis outputs.
+
+## Structure
+- `visualizations/` - Charts and graphs
+- `reports/` - Analysis reports and summaries
+"""
+
+NOTEBOOKS_README = """# Notebooks Directory
+
+This directory contains Jupyter notebooks for exploratory analysis.
+
+## Notebooks
+- `exploratory_analysis.ipynb` - Main analysis notebook
+- `visualization_gallery.ipynb` - All visualizations
+"""
+
+ANALYSIS_CONFIG = """# Blue Salt Analysis Configuration
+
+project:
+  name: Blue Salt Customer Analysis
+  version: 1.0.0
+  author: Your Name
+
+data:
+  sample_size: 7
+  date_range:
+    start: 2025-01-15
+    end: 2025-01-20
+
+analysis:
+  confidence_level: 0.95
+  min_segment_size: 3
+"""
+
+TEST_ANALYSIS = '''import pytest
+import pandas as pd
+from blue_salt_customer_analysis import BlueSaltAnalysis
+
+def test_data_loading():
+    """Test that data loads correctly."""
+    analyzer = BlueSaltAnalysis()
+    data = analyzer.collect_interview_data()
+    assert len(data) == 7
+    assert 'participant_id' in data.columns
+'''
+
+RUN_SCRIPT = """#!/bin/bash
+# Run the complete Blue Salt analysis pipeline
+
+echo 'Starting Blue Salt Customer Analysis...'
+echo '======================================'
+
+# Check Python version
+python --version
+
+# Install requirements if needed
+if [ ! -d 'venv' ]; then
+    echo 'Creating virtual environment...'
+    python -m venv venv
+    source venv/bin/activate
+    pip install -r requirements.txt
+fi
+
+# Run main analysis
+python blue_salt_customer_analysis.py
+
+# Generate sample outputs
+python generate_sample_outputs.py
+
+echo 'Analysis complete! Check outputs/ directory for results.'
+"""
+
+# Placeholder files written into the new structure (path -> contents)
+FILES = {
+    'data/README.md': DATA_README,
+    'data/raw/.gitkeep': "# This file ensures the directory is tracked by git\n",
+    'outputs/README.md': OUTPUTS_README,
+    'notebooks/README.md': NOTEBOOKS_README,
+    'config/analysis_config.yaml': ANALYSIS_CONFIG,
+    'tests/test_analysis.py': TEST_ANALYSIS,
+    'run_analysis.sh': RUN_SCRIPT,
+}
+
+def leaf_directories(directories):
+    """Return the directories that are not a parent of another entry."""
+    paths = sorted({Path(d) for d in directories}, key=lambda p: len(p.parts), reverse=True)
+    leaves = []
+    for path in paths:
+        if not any(path in leaf.parents for leaf in leaves):
+            leaves.append(path)
+    return leaves
 
 def create_project_structure():
     """Create the complete project directory structure."""
     
-    # Define directory structure
-    directories = [
-        'data',
-        'data/raw',
-        'data/raw/transcripts',
-        'data/processed',
-        'outputs',
-        'outputs/visualizations',
-        'outputs/reports',
-        'notebooks',
-        'scripts',
-        'config',
-        'tests',
-        'docs'
-    ]
-    
     # Create directories
     print("Creating project directory structure...")
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
-        print(f"  ✓ Created {directory}/")
+    for path in leaf_directories(DIRECTORIES):
+        path.mkdir(parents=True, exist_ok=True)
+    print("\n".join(f"  ✓ Created {directory}/" for directory in DIRECTORIES))
     
     # Create placeholder files
     print("\nCreating placeholder files...")
-    
-    # Data directory READMEs
-    with open('data/README.md', 'w') as f:
-        f.write("# Data Directory\n\n")
-        f.write("This directory contains all data files for the Blue Salt analysis.\n\n")
-        f.write("## Structure\n")
-        f.write("- `raw/` - Original interview data and transcripts\n")
-        f.write("- `processed/` - Cleaned and processed data files\n\n")
-        f.write("## Privacy Note\n")
-        f.write("All participant data is anonymized. Raw transcripts are not tracked in git.\n")
-    
-    with open('data/raw/.gitkeep', 'w') as f:
-        f.write("# This file ensures the directory is tracked by git\n")
-    
-    # Output directory README
-    with open('outputs/README.md', 'w') as f:
-        f.write("# Output Directory\n\n")
-        f.write("This directory contains all analysis outputs.\n\n")
-        f.write("## Structure\n")
-        f.write("- `visualizations/` - Charts and graphs\n")
-        f.write("- `reports/` - Analysis reports and summaries\n")
-    
-    # Notebooks README
-    with open('notebooks/README.md', 'w') as f:
-        f.write("# Notebooks Directory\n\n")
-        f.write("This directory contains Jupyter notebooks for exploratory analysis.\n\n")
-        f.write("## Notebooks\n")
-        f.write("- `exploratory_analysis.ipynb` - Main analysis notebook\n")
-        f.write("- `visualization_gallery.ipynb` - All visualizations\n")
-    
-    # Create sample config file
-    with open('config/analysis_config.yaml', 'w') as f:
-        f.write("# Blue Salt Analysis Configuration\n\n")
-        f.write("project:\n")
-        f.write("  name: Blue Salt Customer Analysis\n")
-        f.write("  version: 1.0.0\n")
-        f.write("  author: Your Name\n\n")
-        f.write("data:\n")
-        f.write("  sample_size: 7\n")
-        f.write("  date_range:\n")
-        f.write("    start: 2025-01-15\n")
-        f.write("    end: 2025-01-20\n\n")
-        f.write("analysis:\n")
-        f.write("  confidence_level: 0.95\n")
-        f.write("  min_segment_size: 3\n")
-    
-    # Create test file
-    with open('tests/test_analysis.py', 'w') as f:
-        f.write("import pytest\n")
-        f.write("import pandas as pd\n")
-        f.write("from blue_salt_customer_analysis import BlueSaltAnalysis\n\n")
-        f.write("def test_data_loading():\n")
-        f.write("    \"\"\"Test that data loads correctly.\"\"\"\n")
-        f.write("    analyzer = BlueSaltAnalysis()\n")
-        f.write("    data = analyzer.collect_interview_data()\n")
-        f.write("    assert len(data) == 7\n")
-        f.write("    assert 'participant_id' in data.columns\n")
+    for name, text in FILES.items():
+        Path(name).write_text(text)
     
     print("  ✓ Created README files")
     print("  ✓ Created configuration files")
     print("  ✓ Created test templates")
     
-    # Create run script
-    with open('run_analysis.sh', 'w') as f:
-        f.write("#!/bin/bash\n")
-        f.write("# Run the complete Blue Salt analysis pipeline\n\n")
-        f.write("echo 'Starting Blue Salt Customer Analysis...'\n")
-        f.write("echo '======================================'\n\n")
-        f.write("# Check Python version\n")
-        f.write("python --version\n\n")
-        f.write("# Install requirements if needed\n")
-        f.write("if [ ! -d 'venv' ]; then\n")
-        f.write("    echo 'Creating virtual environment...'\n")
-        f.write("    python -m venv venv\n")
-        f.write("    source venv/bin/activate\n")
-        f.write("    pip install -r requirements.txt\n")
-        f.write("fi\n\n")
-        f.write("# Run main analysis\n")
-        f.write("python blue_salt_customer_analysis.py\n\n")
-        f.write("# Generate sample outputs\n")
-        f.write("python generate_sample_outputs.py\n\n")
-        f.write("echo 'Analysis complete! Check outputs/ directory for results.'\n")
-    
     # Make run script executable
-    os.chmod('run_analysis.sh', 0o755)
+    Path('run_analysis.sh').chmod(0o755)
     
     print("  ✓ Created run script")
     
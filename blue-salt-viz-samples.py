@@ -6,22 +6,42 @@ This script creates sample visualizations to demonstrate
 what the analysis outputs would look like.
 """
 
+import io
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 
+def _save_async(exe, fig, path):
+    """Encode fig to PNG now and hand the disk write to exe."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+    return exe.submit(Path(path).write_bytes, buf.getvalue())
+
 def create_sample_visualizations():
     """Create sample output visualizations for the project."""
     
     # Set style
     plt.style.use('seaborn-v0_8-whitegrid')
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    
+    # One figure is reused for every sample, cleared between plots; PNGs are
+    # encoded in memory and written to disk on a worker thread
+    fig = plt.figure(figsize=(8, 6))
+    exe = ThreadPoolExecutor(max_workers=2)
+    writes = []
     
     # 1. JTBD Distribution Sample
-    fig, ax = plt.subplots(figsize=(8, 6))
+    ax = fig.subplots()
     jobs = ['Social\nBonding', 'Healthy\nMeal', 'Gratification']
     percentages = [43, 29, 29]
     colors = ['#667eea', '#764ba2', '#f093fb']
     
-    bars = ax.bar(jobs, percentages, color=colors, alpha=0.8)
+    bars = ax.bar(jobs, percentages, color=colors, alpha=0.8, rasterized=True)
     
     # Add percentage labels
     for bar, pct in zip(bars, percentages):
@@ -35,12 +55,13 @@ def create_sample_visualizations():
     ax.set_title('Jobs to be Done Distribution - Blue Salt', fontsize=14, fontweight='bold')
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('outputs/visualizations/jtbd_distribution_sample.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    writes.append(_save_async(exe, fig, 'outputs/visualizations/jtbd_distribution_sample.png'))
+    fig.clear()
     
     # 2. Customer Journey Satisfaction Sample
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig.set_size_inches(10, 6)
+    ax = fig.subplots()
     
     stages = ['Awareness', 'Consideration', 'Purchase', 'Usage', 'Loyalty']
     satisfaction = [75, 65, 70, 45, 60]
@@ -48,7 +69,7 @@ def create_sample_visualizations():
     # Create line plot with area fill
     x = np.arange(len(stages))
     ax.plot(x, satisfaction, 'o-', color='#667eea', linewidth=3, markersize=10)
-    ax.fill_between(x, satisfaction, alpha=0.3, color='#667eea')
+    ax.fill_between(x, satisfaction, alpha=0.3, color='#667eea', rasterized=True)
     
     # Add value labels
     for i, (stage, score) in enumerate(zip(stages, satisfaction)):
@@ -71,9 +92,14 @@ def create_sample_visualizations():
     ax.set_title('Customer Satisfaction Across Journey Stages', fontsize=14, fontweight='bold')
     ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig('outputs/visualizations/journey_satisfaction_sample.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    writes.append(_save_async(exe, fig, 'outputs/visualizations/journey_satisfaction_sample.png'))
+    plt.close(fig)
+    
+    # Wait for the writes and re-raise any I/O error
+    exe.shutdown(wait=True)
+    for write in writes:
+        write.result()
     
     print("✓ Sample visualizations created successfully!")
     print("  - outputs/visualizations/jtbd_distribution_sample.png")
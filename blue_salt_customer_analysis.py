@@ -22,20 +22,122 @@ Dependencies:
     - numpy: For numerical operations
     - matplotlib: For visualizations
     - seaborn: For statistical plots
+    - pyarrow: For Parquet export of the cleaned dataset
 """
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import sys
+import json
+import hashlib
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for visualizations
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# Console section banners
+_BANNER = '=' * 60
+
+
+def _section(title: str) -> str:
+    """Return a step title framed by banner lines, preceded by a blank line."""
+    return f'\n{_BANNER}\n{title}\n{_BANNER}'
+
+
+# Low-cardinality string fields stored as categoricals (integer codes + a
+# small categories array) instead of object columns
+_CATEGORICAL_COLUMNS = (
+    'alias', 'gender', 'location', 'education', 'usage_frequency',
+    'purchase_reason', 'price_perception', 'taste_perception',
+    'visual_expectation', 'would_recommend', 'primary_jtbd', 'key_pain_point'
+)
+
+# Raw usage answers collapsed into three usage categories
+_USAGE_MAPPING = {
+    'daily': 'daily',
+    'every_other_day': 'daily',
+    'regular': 'weekly',
+    'twice_weekly': 'weekly',
+    'once_weekly': 'weekly',
+    'special_occasions': 'occasional',
+    'once': 'occasional'
+}
+
+# Category sets behind the binary features
+_PRICE_CONCERN = frozenset({'too_high', 'price_concern', 'wants_reduction', 'high'})
+_VISUAL_NEGATIVE = frozenset({'not_very_blue', 'not_blue_enough', 'not_as_blue'})
+_POSITIVE_TASTE = frozenset({'impressed', 'crispier_taste', 'enjoyed_taste', 'loves_quality', 'better_than_others'})
+_RECOMMEND_NEG = frozenset({'50-50', 'no'})
+
+# Binary features derived in clean_and_preprocess:
+# name -> (source column, category values, invert membership)
+BINARY_FEATURES = {
+    'has_price_concern': ('price_perception', _PRICE_CONCERN, False),
+    'disappointed_visual': ('visual_expectation', _VISUAL_NEGATIVE, False),
+    'positive_taste': ('taste_perception', _POSITIVE_TASTE, False),
+    'would_recommend_binary': ('would_recommend', _RECOMMEND_NEG, True),
+}
+
+# Figures written by create_visualizations
+_DASHBOARD_PNG = 'blue_salt_analysis_dashboard.png'
+_JOURNEY_PNG = 'customer_journey_satisfaction.png'
+
+# Columns whose frequency tables are shared across the analysis steps
+_COUNT_COLUMNS = ('gender', 'location', 'education', 'primary_jtbd', 'usage_category', 'key_pain_point')
+
+# Income bracket edges and labels
+_INCOME_BINS = np.array([0, 100000, 200000, 400000], dtype=np.uint32)
+_INCOME_LABELS = ('<100k', '100k-200k', '200k+')
+
+
+def _cat_counts(col: pd.Series) -> pd.Series:
+    """
+    Count category frequencies with a bincount over the integer codes.
+    
+    Returns the counts most common first (ties in category order), matching
+    the value_counts() ordering the analysis steps rely on.
+    """
+    cats = col.astype('category').cat
+    codes = cats.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(cats.categories))
+    return pd.Series(counts, index=cats.categories, name='count').sort_values(ascending=False, kind='stable')
+
+
+@lru_cache(maxsize=1)
+def _pyplot():
+    """
+    Import pyplot on first use, configured for headless rendering.
+    
+    matplotlib and seaborn are only needed by create_visualizations, so
+    analysis-only runs never pay their import cost. The style is applied
+    once per process.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # Set style for visualizations
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("husl")
+    return plt
+
+
+def _write_png(fig, path: str, dpi: int = 300):
+    """
+    Render fig once through its Agg canvas and write the PNG bytes to path.
+    
+    print_png draws the canvas itself, so no separate draw() is needed, and
+    the layout is already fixed by constrained_layout.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    fig.set_dpi(dpi)
+    canvas = FigureCanvasAgg(fig)
+    with open(path, 'wb') as f:
+        canvas.print_png(f, metadata={'Software': None})
 
 
 class BlueSaltAnalysis:
@@ -46,11 +148,23 @@ class BlueSaltAnalysis:
     of customer interview data to derive strategic insights.
     """
     
-    def __init__(self):
-        """Initialize the analysis with empty data structures."""
+    def __init__(self, verbose: bool = False):
+        """
+        Initialize the analysis with empty data structures.
+        
+        Args:
+            verbose: Print progress and results of each step to stdout
+        """
+        self.verbose = verbose
         self.raw_data = None
         self.clean_data = None
         self.analysis_results = {}
+        self._stats = None
+    
+    def _emit(self, *lines: str):
+        """Write lines to stdout in a single call when running verbosely."""
+        if self.verbose:
+            sys.stdout.write('\n'.join(lines) + '\n')
         
     def collect_interview_data(self) -> pd.DataFrame:
         """
@@ -62,10 +176,8 @@ class BlueSaltAnalysis:
         Returns:
             pd.DataFrame: Raw interview data
         """
-        print("="*60)
-        print("STEP 1: DATA COLLECTION")
-        print("="*60)
-        print("Collecting data from 7 customer interviews...")
+        self._emit(_BANNER, "STEP 1: DATA COLLECTION", _BANNER)
+        self._emit("Collecting data from 7 customer interviews...")
         
         # Interview data structured from actual responses
         interview_data = {
@@ -87,10 +199,31 @@ class BlueSaltAnalysis:
             'interview_date': ['2025-01-15', '2025-01-16', '2025-01-16', '2025-01-17', '2025-01-18', '2025-01-19', '2025-01-20']
         }
         
-        self.raw_data = pd.DataFrame(interview_data)
-        print(f"✓ Collected data from {len(self.raw_data)} participants")
-        print(f"✓ Data fields: {list(self.raw_data.columns)}")
-        print(f"✓ Date range: {self.raw_data['interview_date'].min()} to {self.raw_data['interview_date'].max()}")
+        # Build a typed frame column-by-column rather than letting pandas
+        # infer object dtype for every field
+        columns = {}
+        for col, values in interview_data.items():
+            if col in _CATEGORICAL_COLUMNS:
+                columns[col] = pd.Categorical(values, categories=sorted(set(values)))
+            elif col == 'interview_date':
+                columns[col] = pd.to_datetime(values, format='%Y-%m-%d', cache=True).values.astype('datetime64[D]')
+            else:
+                columns[col] = values
+        
+        self.raw_data = pd.DataFrame(columns)
+        
+        # Numeric columns are stored at their narrowest unsigned width
+        # (age -> uint8, income -> uint32)
+        self.raw_data['age'] = pd.to_numeric(self.raw_data['age'], downcast='unsigned')
+        self.raw_data['income'] = pd.to_numeric(self.raw_data['income'], downcast='unsigned')
+        if self.raw_data['age'].dtype != np.uint8:
+            raise ValueError(
+                f"Ages must be whole numbers between 0 and 255, got dtype {self.raw_data['age'].dtype}"
+            )
+        
+        self._emit(f"✓ Collected data from {len(self.raw_data)} participants")
+        self._emit(f"✓ Data fields: {list(self.raw_data.columns)}")
+        self._emit(f"✓ Date range: {self.raw_data['interview_date'].min():%Y-%m-%d} to {self.raw_data['interview_date'].max():%Y-%m-%d}")
         
         return self.raw_data
     
@@ -107,61 +240,98 @@ class BlueSaltAnalysis:
         Returns:
             pd.DataFrame: Cleaned data ready for analysis
         """
-        print("\n" + "="*60)
-        print("STEP 2: DATA CLEANING & PREPROCESSING")
-        print("="*60)
+        self._emit(_section("STEP 2: DATA CLEANING & PREPROCESSING"))
         
         if self.raw_data is None:
             raise ValueError("No raw data available. Run collect_interview_data() first.")
         
-        self.clean_data = self.raw_data.copy()
+        # Shallow copy: cleaning only adds new columns and never writes into
+        # the raw ones, so the column buffers can be shared
+        self.clean_data = self.raw_data.copy(deep=False)
+        self._stats = None
         
         # 1. Check for missing values
-        print("1. Checking for missing values...")
+        self._emit("1. Checking for missing values...")
         missing_counts = self.clean_data.isnull().sum()
-        print(f"   Missing values found: {missing_counts.sum()}")
+        self._emit(f"   Missing values found: {missing_counts.sum()}")
         
         # 2. Standardize usage frequency
-        print("\n2. Standardizing usage frequency categories...")
-        usage_mapping = {
-            'daily': 'daily',
-            'every_other_day': 'daily',
-            'regular': 'weekly',
-            'twice_weekly': 'weekly',
-            'once_weekly': 'weekly',
-            'special_occasions': 'occasional',
-            'once': 'occasional'
-        }
-        self.clean_data['usage_category'] = self.clean_data['usage_frequency'].map(usage_mapping)
-        print(f"   ✓ Mapped {len(usage_mapping)} usage patterns to 3 categories")
+        self._emit("\n2. Standardizing usage frequency categories...")
+        # rename_categories rejects many-to-one mappings, so map the 7 source
+        # categories and gather the new codes through the existing ones
+        usage = self.clean_data['usage_frequency'].astype('category').cat
+        mapped = pd.Categorical(usage.categories.map(_USAGE_MAPPING))
+        # Trailing -1 keeps missing values (code -1) missing after the gather
+        lookup = np.append(mapped.codes, -1)
+        self.clean_data['usage_category'] = pd.Categorical.from_codes(
+            lookup[usage.codes.to_numpy()], categories=mapped.categories
+        )
+        self._emit(f"   ✓ Mapped {len(_USAGE_MAPPING)} usage patterns to 3 categories")
         
         # 3. Create binary features
-        print("\n3. Creating binary features for analysis...")
-        self.clean_data['has_price_concern'] = self.clean_data['price_perception'].isin(['too_high', 'price_concern', 'wants_reduction', 'high']).astype(int)
-        self.clean_data['disappointed_visual'] = self.clean_data['visual_expectation'].str.contains('not|enough', na=False).astype(int)
-        self.clean_data['positive_taste'] = self.clean_data['taste_perception'].isin(['impressed', 'crispier_taste', 'enjoyed_taste', 'loves_quality', 'better_than_others']).astype(int)
-        self.clean_data['would_recommend_binary'] = (~self.clean_data['would_recommend'].isin(['50-50', 'no'])).astype(int)
-        print("   ✓ Created 4 binary features")
+        self._emit("\n3. Creating binary features for analysis...")
+        flags = np.zeros((len(self.clean_data), len(BINARY_FEATURES)), dtype=np.int8)
+        for i, (col, values, invert) in enumerate(BINARY_FEATURES.values()):
+            # Resolve the category values to codes once, then compare ints
+            cats = self.clean_data[col].astype('category').cat
+            target_codes = [cats.categories.get_loc(v) for v in values if v in cats.categories]
+            flags[:, i] = np.isin(cats.codes.to_numpy(), target_codes, invert=invert)
+        self.clean_data[list(BINARY_FEATURES)] = flags
+        self._emit(f"   ✓ Created {len(BINARY_FEATURES)} binary features")
         
         # 4. Income brackets
-        print("\n4. Creating income brackets...")
-        self.clean_data['income_bracket'] = pd.cut(
-            self.clean_data['income'],
-            bins=[0, 100000, 200000, 400000],
-            labels=['<100k', '100k-200k', '200k+']
+        self._emit("\n4. Creating income brackets...")
+        # Right-closed bins as in pd.cut: side='left' puts an income equal to
+        # an edge in the lower bracket; values outside the edges become NaN
+        codes = np.searchsorted(_INCOME_BINS, self.clean_data['income'].to_numpy(), side='left').astype(np.int8) - 1
+        codes[codes >= len(_INCOME_LABELS)] = -1
+        self.clean_data['income_bracket'] = pd.Categorical.from_codes(
+            codes, categories=_INCOME_LABELS, ordered=True
         )
-        print(f"   ✓ Categorized income into {self.clean_data['income_bracket'].nunique()} brackets")
+        self._emit(f"   ✓ Categorized income into {self.clean_data['income_bracket'].nunique()} brackets")
         
         # 5. Data validation
-        print("\n5. Validating data integrity...")
-        print(f"   ✓ All participant IDs unique: {self.clean_data['participant_id'].is_unique}")
-        print(f"   ✓ Age range valid (18-100): {self.clean_data['age'].between(18, 100).all()}")
-        print(f"   ✓ Income values positive: {(self.clean_data['income'] > 0).all()}")
+        self._emit("\n5. Validating data integrity...")
+        self._emit(f"   ✓ All participant IDs unique: {self.clean_data['participant_id'].is_unique}")
+        self._emit(f"   ✓ Age range valid (18-100): {self.clean_data['age'].between(18, 100).all()}")
+        self._emit(f"   ✓ Income values positive: {(self.clean_data['income'] > 0).all()}")
         
-        print(f"\n✓ Data cleaning complete. Final dataset: {self.clean_data.shape}")
+        self._emit(f"\n✓ Data cleaning complete. Final dataset: {self.clean_data.shape}")
         
         return self.clean_data
     
+    def _gb(self, by):
+        """
+        Group clean_data with observed=True.
+        
+        Grouping keys are categoricals, so this keeps unused categories out
+        of the result instead of materialising empty groups.
+        """
+        return self.clean_data.groupby(by, observed=True)
+    
+    def _compute_all_stats(self) -> Dict:
+        """
+        Compute the reductions shared by the analysis steps in one batch.
+        
+        Results are cached in self._stats (reset by clean_and_preprocess) so
+        each analyze_* method only formats what it needs.
+        
+        Returns:
+            Dict: Numeric summaries, frequency tables and income groupings
+        """
+        if self._stats is not None:
+            return self._stats
+        
+        stats = {
+            'numeric': self.clean_data.agg({'age': ['mean', 'std', 'count'], 'income': ['mean', 'median']}),
+            'counts': {col: _cat_counts(self.clean_data[col]) for col in _COUNT_COLUMNS},
+            'income_by_jtbd': self._gb('primary_jtbd')['income'].agg(['mean', 'count']),
+            'income_by_usage': self._gb('usage_category')['income'].mean()
+        }
+        
+        self._stats = stats
+        return stats
+    
     def analyze_demographics(self) -> Dict:
         """
         Analyze demographic characteristics of interview participants.
@@ -169,27 +339,30 @@ class BlueSaltAnalysis:
         Returns:
             Dict: Summary statistics and insights
         """
-        print("\n" + "="*60)
-        print("STEP 3: DEMOGRAPHIC ANALYSIS")
-        print("="*60)
+        lines = [_section("STEP 3: DEMOGRAPHIC ANALYSIS")]
+        
+        stats = self._compute_all_stats()
+        numeric = stats['numeric']
+        counts = stats['counts']
         
         demographics = {
-            'sample_size': len(self.clean_data),
-            'avg_age': self.clean_data['age'].mean(),
-            'age_std': self.clean_data['age'].std(),
-            'avg_income': self.clean_data['income'].mean(),
-            'income_median': self.clean_data['income'].median(),
-            'gender_split': self.clean_data['gender'].value_counts().to_dict(),
-            'location_distribution': self.clean_data['location'].value_counts().to_dict(),
-            'education_levels': self.clean_data['education'].value_counts().to_dict()
+            'sample_size': int(numeric.loc['count', 'age']),
+            'avg_age': numeric.loc['mean', 'age'],
+            'age_std': numeric.loc['std', 'age'],
+            'avg_income': numeric.loc['mean', 'income'],
+            'income_median': numeric.loc['median', 'income'],
+            'gender_split': counts['gender'].to_dict(),
+            'location_distribution': counts['location'].to_dict(),
+            'education_levels': counts['education'].to_dict()
         }
         
-        print(f"Sample Size: {demographics['sample_size']} participants")
-        print(f"Average Age: {demographics['avg_age']:.1f} years (SD: {demographics['age_std']:.1f})")
-        print(f"Average Income: ${demographics['avg_income']:,.0f}")
-        print(f"Median Income: ${demographics['income_median']:,.0f}")
-        print(f"Gender Split: {demographics['gender_split']}")
+        lines.append(f"Sample Size: {demographics['sample_size']} participants")
+        lines.append(f"Average Age: {demographics['avg_age']:.1f} years (SD: {demographics['age_std']:.1f})")
+        lines.append(f"Average Income: ${demographics['avg_income']:,.0f}")
+        lines.append(f"Median Income: ${demographics['income_median']:,.0f}")
+        lines.append(f"Gender Split: {demographics['gender_split']}")
         
+        self._emit(*lines)
         self.analysis_results['demographics'] = demographics
         return demographics
     
@@ -200,35 +373,45 @@ class BlueSaltAnalysis:
         Returns:
             Dict: JTBD analysis results
         """
-        print("\n" + "="*60)
-        print("STEP 4: JOBS TO BE DONE ANALYSIS")
-        print("="*60)
+        lines = [_section("STEP 4: JOBS TO BE DONE ANALYSIS")]
         
         # JTBD distribution
-        jtbd_counts = self.clean_data['primary_jtbd'].value_counts()
-        jtbd_percentages = (jtbd_counts / len(self.clean_data) * 100).round(1)
+        stats = self._compute_all_stats()
+        jtbd_counts = stats['counts']['primary_jtbd']
+        jtbd_percentages = (jtbd_counts * (100.0 / len(self.clean_data))).round(1)
         
-        print("Primary Jobs Distribution:")
+        lines.append("Primary Jobs Distribution:")
         for job, pct in jtbd_percentages.items():
-            print(f"  {job}: {pct}% ({jtbd_counts[job]} customers)")
+            lines.append(f"  {job}: {pct}% ({jtbd_counts[job]} customers)")
         
         # JTBD by demographics
-        jtbd_by_income = pd.crosstab(self.clean_data['income_bracket'], self.clean_data['primary_jtbd'])
+        jtbd_by_income = (
+            self._gb(['income_bracket', 'primary_jtbd'])
+            .size()
+            .unstack('primary_jtbd', fill_value=0)
+        )
         
         # Average income by JTBD
-        income_by_jtbd = self.clean_data.groupby('primary_jtbd')['income'].agg(['mean', 'count'])
+        income_by_jtbd = stats['income_by_jtbd']
+        
+        # Unbox each result from one contiguous buffer rather than cell by cell
+        arr = jtbd_by_income.to_numpy()
+        idx = jtbd_by_income.index.tolist()
+        jtbd_by_income_dict = {c: dict(zip(idx, arr[:, j].tolist())) for j, c in enumerate(jtbd_by_income.columns.tolist())}
+        avg_income_by_job = dict(zip(income_by_jtbd.index.tolist(), income_by_jtbd['mean'].to_numpy().tolist()))
         
         jtbd_analysis = {
             'distribution': jtbd_percentages.to_dict(),
             'counts': jtbd_counts.to_dict(),
-            'by_income_bracket': jtbd_by_income.to_dict(),
-            'avg_income_by_job': income_by_jtbd['mean'].to_dict(),
+            'by_income_bracket': jtbd_by_income_dict,
+            'avg_income_by_job': avg_income_by_job,
             'dominant_job': jtbd_counts.index[0] if len(jtbd_counts) > 0 else None,
             'job_concentration': jtbd_percentages.iloc[0] if len(jtbd_percentages) > 0 else 0
         }
         
-        print(f"\n⚠️  No dominant job: highest concentration is only {jtbd_analysis['job_concentration']}%")
+        lines.append(f"\n⚠️  No dominant job: highest concentration is only {jtbd_analysis['job_concentration']}%")
         
+        self._emit(*lines)
         self.analysis_results['jtbd'] = jtbd_analysis
         return jtbd_analysis
     
@@ -239,22 +422,28 @@ class BlueSaltAnalysis:
         Returns:
             Dict: Pain point analysis
         """
-        print("\n" + "="*60)
-        print("STEP 5: PAIN POINT ANALYSIS")
-        print("="*60)
+        lines = [_section("STEP 5: PAIN POINT ANALYSIS")]
+        
+        stats = self._compute_all_stats()
+        n = len(self.clean_data)
+        
+        # One reduction over the flag columns, one broadcast to percentages
+        sums = self.clean_data[['has_price_concern', 'disappointed_visual', 'positive_taste']].sum().to_numpy()
+        pcts = np.array([sums[0], sums[1], n - sums[2]]) * (100.0 / n)
         
         pain_points = {
-            'price_concerns': (self.clean_data['has_price_concern'].sum() / len(self.clean_data) * 100),
-            'visual_disappointment': (self.clean_data['disappointed_visual'].sum() / len(self.clean_data) * 100),
-            'taste_uncertainty': ((~self.clean_data['positive_taste']).sum() / len(self.clean_data) * 100),
-            'key_pain_themes': self.clean_data['key_pain_point'].value_counts().to_dict()
+            'price_concerns': pcts[0],
+            'visual_disappointment': pcts[1],
+            'taste_uncertainty': pcts[2],
+            'key_pain_themes': stats['counts']['key_pain_point'].to_dict()
         }
         
-        print("Major Pain Points:")
-        print(f"  Price Concerns: {pain_points['price_concerns']:.0f}%")
-        print(f"  Visual Disappointment: {pain_points['visual_disappointment']:.0f}%")
-        print(f"  Taste Uncertainty: {pain_points['taste_uncertainty']:.0f}%")
+        lines.append("Major Pain Points:")
+        lines.append(f"  Price Concerns: {pain_points['price_concerns']:.0f}%")
+        lines.append(f"  Visual Disappointment: {pain_points['visual_disappointment']:.0f}%")
+        lines.append(f"  Taste Uncertainty: {pain_points['taste_uncertainty']:.0f}%")
         
+        self._emit(*lines)
         self.analysis_results['pain_points'] = pain_points
         return pain_points
     
@@ -265,29 +454,33 @@ class BlueSaltAnalysis:
         Returns:
             Dict: Usage pattern insights
         """
-        print("\n" + "="*60)
-        print("STEP 6: USAGE PATTERN ANALYSIS")
-        print("="*60)
+        lines = [_section("STEP 6: USAGE PATTERN ANALYSIS")]
+        
+        stats = self._compute_all_stats()
+        usage_dist = stats['counts']['usage_category']
+        usage_by_income = stats['income_by_usage']
+        n = len(self.clean_data)
         
-        usage_dist = self.clean_data['usage_category'].value_counts()
-        usage_by_income = self.clean_data.groupby('usage_category')['income'].mean()
+        counts = usage_dist.reindex(['daily', 'occasional', 'weekly'], fill_value=0).to_numpy()
+        pcts = counts * (100.0 / n)
         
         usage_analysis = {
-            'distribution': (usage_dist / len(self.clean_data) * 100).round(1).to_dict(),
+            'distribution': (usage_dist * (100.0 / n)).round(1).to_dict(),
             'avg_income_by_usage': usage_by_income.to_dict(),
-            'daily_users_pct': (usage_dist.get('daily', 0) / len(self.clean_data) * 100),
-            'occasional_users_pct': (usage_dist.get('occasional', 0) / len(self.clean_data) * 100)
+            'daily_users_pct': pcts[0],
+            'occasional_users_pct': pcts[1]
         }
         
-        print("Usage Frequency Distribution:")
+        lines.append("Usage Frequency Distribution:")
         for category, pct in usage_analysis['distribution'].items():
             avg_income = usage_analysis['avg_income_by_usage'][category]
-            print(f"  {category}: {pct}% (avg income: ${avg_income:,.0f})")
+            lines.append(f"  {category}: {pct}% (avg income: ${avg_income:,.0f})")
         
         # Key insight
         if usage_analysis['avg_income_by_usage'].get('occasional', 0) > usage_analysis['avg_income_by_usage'].get('daily', 0):
-            print("\n💡 KEY INSIGHT: Higher income correlates with less frequent use!")
+            lines.append("\n💡 KEY INSIGHT: Higher income correlates with less frequent use!")
         
+        self._emit(*lines)
         self.analysis_results['usage'] = usage_analysis
         return usage_analysis
     
@@ -298,9 +491,7 @@ class BlueSaltAnalysis:
         Returns:
             Dict: Strategic recommendations
         """
-        print("\n" + "="*60)
-        print("STEP 7: STRATEGIC RECOMMENDATIONS")
-        print("="*60)
+        self._emit(_section("STEP 7: STRATEGIC RECOMMENDATIONS"))
         
         # Determine primary strategic direction based on data
         jtbd_dist = self.analysis_results['jtbd']['distribution']
@@ -340,30 +531,51 @@ class BlueSaltAnalysis:
             ]
         }
         
-        print("Strategic Pivot Recommendation:")
-        print(f"  FROM: {recommendations['positioning']['from']}")
-        print(f"  TO:   {recommendations['positioning']['to']}")
-        print(f"\nPrice Adjustment: {recommendations['pricing']['from']} → {recommendations['pricing']['to']}")
+        self._emit("Strategic Pivot Recommendation:")
+        self._emit(f"  FROM: {recommendations['positioning']['from']}")
+        self._emit(f"  TO:   {recommendations['positioning']['to']}")
+        self._emit(f"\nPrice Adjustment: {recommendations['pricing']['from']} → {recommendations['pricing']['to']}")
         
         self.analysis_results['recommendations'] = recommendations
         return recommendations
     
+    def _output_hash(self) -> str:
+        """Return a short content hash of the cleaned data."""
+        row_hashes = pd.util.hash_pandas_object(self.clean_data, index=False)
+        return hashlib.blake2b(row_hashes.values.tobytes(), digest_size=8).hexdigest()
+    
     def create_visualizations(self):
-        """Create comprehensive visualizations of the analysis."""
-        print("\n" + "="*60)
-        print("STEP 8: CREATING VISUALIZATIONS")
-        print("="*60)
+        """
+        Create comprehensive visualizations of the analysis.
         
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        Each PNG is written next to a .hash file holding the content hash of
+        the data it was rendered from; figures whose hash still matches are
+        not regenerated.
+        """
+        self._emit(_section("STEP 8: CREATING VISUALIZATIONS"))
+        
+        digest = self._output_hash()
+        for path, plot in ((_DASHBOARD_PNG, self._plot_dashboard),
+                           (_JOURNEY_PNG, self._plot_journey_map)):
+            hash_file = Path(path + '.hash')
+            if Path(path).exists() and hash_file.exists() and hash_file.read_text() == digest:
+                self._emit(f"✓ '{path}' is up to date, skipping")
+                continue
+            plot(path)
+            hash_file.write_text(digest)
+    
+    def _plot_dashboard(self, path: str):
+        """Render the 2x2 analysis dashboard to path."""
+        plt = _pyplot()
+        fig, axes = plt.subplots(2, 2, figsize=(15, 12), constrained_layout=True)
         fig.suptitle('Blue Salt Customer Analysis Dashboard', fontsize=16, fontweight='bold')
         
         # 1. Jobs to be Done Distribution
         ax1 = axes[0, 0]
         jtbd_data = pd.Series(self.analysis_results['jtbd']['distribution'])
         jtbd_data.plot(kind='bar', ax=ax1, color=['#667eea', '#764ba2', '#f093fb'])
-        ax1.set_title('Jobs to be Done Distribution', fontsize=14, fontweight='bold')
-        ax1.set_ylabel('Percentage (%)')
-        ax1.set_xlabel('Primary Job')
+        ax1.update({'title': 'Jobs to be Done Distribution', 'ylabel': 'Percentage (%)', 'xlabel': 'Primary Job'})
+        ax1.title.set(fontsize=14, fontweight='bold')
         ax1.tick_params(axis='x', rotation=45)
         
         # Add percentage labels
@@ -378,16 +590,15 @@ class BlueSaltAnalysis:
             'Taste Uncertainty': self.analysis_results['pain_points']['taste_uncertainty']
         })
         pain_data.plot(kind='barh', ax=ax2, color=['#e74c3c', '#e67e22', '#f39c12'])
-        ax2.set_title('Customer Pain Points', fontsize=14, fontweight='bold')
-        ax2.set_xlabel('Percentage of Customers (%)')
+        ax2.update({'title': 'Customer Pain Points', 'xlabel': 'Percentage of Customers (%)'})
+        ax2.title.set(fontsize=14, fontweight='bold')
         
         # 3. Usage Pattern by Income
         ax3 = axes[1, 0]
         usage_income = pd.Series(self.analysis_results['usage']['avg_income_by_usage'])
         usage_income.plot(kind='bar', ax=ax3, color=['#2ecc71', '#3498db', '#9b59b6'])
-        ax3.set_title('Average Income by Usage Pattern', fontsize=14, fontweight='bold')
-        ax3.set_ylabel('Average Income ($)')
-        ax3.set_xlabel('Usage Frequency')
+        ax3.update({'title': 'Average Income by Usage Pattern', 'ylabel': 'Average Income ($)', 'xlabel': 'Usage Frequency'})
+        ax3.title.set(fontsize=14, fontweight='bold')
         ax3.tick_params(axis='x', rotation=45)
         ax3.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x/1000:.0f}K'))
         
@@ -412,23 +623,39 @@ class BlueSaltAnalysis:
                 fontsize=12, verticalalignment='center',
                 bbox=dict(boxstyle='round,pad=1', facecolor='#f0f0f0', alpha=0.8))
         
-        plt.tight_layout()
-        plt.savefig('blue_salt_analysis_dashboard.png', dpi=300, bbox_inches='tight')
-        print("✓ Dashboard saved as 'blue_salt_analysis_dashboard.png'")
+        _write_png(fig, path)
+        plt.close(fig)
+        self._emit(f"✓ Dashboard saved as '{path}'")
+    
+    def _plot_journey_map(self, path: str):
+        """Render customer satisfaction across journey stages to path."""
+        plt = _pyplot()
+        from matplotlib.collections import LineCollection, PolyCollection
         
-        # Create additional visualization for journey stages
-        fig2, ax = plt.subplots(figsize=(12, 6))
+        fig2, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
         
         # Customer satisfaction by journey stage (simulated based on pain points)
         journey_stages = ['Awareness', 'Consideration', 'Purchase', 'Usage', 'Loyalty']
         satisfaction_scores = [75, 65, 70, 45, 60]  # Based on pain point analysis
         
-        ax.plot(journey_stages, satisfaction_scores, 'o-', linewidth=3, markersize=10, color='#667eea')
-        ax.fill_between(range(len(journey_stages)), satisfaction_scores, alpha=0.3, color='#667eea')
-        ax.set_ylim(0, 100)
-        ax.set_ylabel('Satisfaction Score (%)', fontsize=12)
-        ax.set_xlabel('Customer Journey Stage', fontsize=12)
-        ax.set_title('Customer Satisfaction Across Journey Stages', fontsize=14, fontweight='bold')
+        # Filled area and line as two collections instead of plot + fill_between
+        xs = np.arange(len(journey_stages))
+        ys = np.asarray(satisfaction_scores)
+        points = list(zip(xs, ys))
+        ax.add_collection(PolyCollection([points + [(xs[-1], 0), (xs[0], 0)]], alpha=0.3, facecolors='#667eea'))
+        ax.add_collection(LineCollection([points], colors='#667eea', linewidths=3))
+        ax.scatter(xs, ys, s=100, color='#667eea', zorder=3)
+        ax.set_xticks(xs)
+        ax.set_xticklabels(journey_stages)
+        ax.update({
+            'ylim': (0, 100),
+            'ylabel': 'Satisfaction Score (%)',
+            'xlabel': 'Customer Journey Stage',
+            'title': 'Customer Satisfaction Across Journey Stages'
+        })
+        ax.xaxis.label.set_fontsize(12)
+        ax.yaxis.label.set_fontsize(12)
+        ax.title.set(fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3)
         
         # Add annotations for key pain points
@@ -436,35 +663,41 @@ class BlueSaltAnalysis:
                    arrowprops=dict(arrowstyle='->', color='red', alpha=0.7),
                    fontsize=10, color='red')
         
-        plt.tight_layout()
-        plt.savefig('customer_journey_satisfaction.png', dpi=300, bbox_inches='tight')
-        print("✓ Journey map saved as 'customer_journey_satisfaction.png'")
+        _write_png(fig2, path)
+        plt.close(fig2)
+        self._emit(f"✓ Journey map saved as '{path}'")
         
     def generate_report(self):
         """Generate a comprehensive analysis report."""
-        print("\n" + "="*60)
-        print("FINAL REPORT: BLUE SALT CUSTOMER ANALYSIS")
-        print("="*60)
+        self._emit(_section("FINAL REPORT: BLUE SALT CUSTOMER ANALYSIS"))
+        
+        n = len(self.clean_data)
+        pp = self.analysis_results['pain_points']
+        jtbd = self.analysis_results['jtbd']
+        rec = self.analysis_results['recommendations']
+        usage = self.analysis_results['usage']
+        now_str = datetime.now().strftime('%Y-%m-%d')
+        rec_rate = self.clean_data['would_recommend_binary'].sum() * (100.0 / n)
         
         report = f"""
         EXECUTIVE SUMMARY
         ================
-        Analysis Date: {datetime.now().strftime('%Y-%m-%d')}
-        Sample Size: {len(self.clean_data)} customers
+        Analysis Date: {now_str}
+        Sample Size: {n} customers
         
         KEY FINDINGS
         -----------
-        1. No Dominant Job: Customers split across 3 jobs with highest at {self.analysis_results['jtbd']['job_concentration']:.0f}%
-        2. Major Pain Points: {self.analysis_results['pain_points']['visual_disappointment']:.0f}% visual disappointment, {self.analysis_results['pain_points']['price_concerns']:.0f}% price concerns
-        3. Usage Paradox: Higher income (${self.analysis_results['usage']['avg_income_by_usage'].get('occasional', 0):,.0f}) = Less frequent use
-        4. Value Confusion: Despite {(self.clean_data['would_recommend_binary'].sum()/len(self.clean_data)*100):.0f}% recommendation rate, unclear value proposition
+        1. No Dominant Job: Customers split across 3 jobs with highest at {jtbd['job_concentration']:.0f}%
+        2. Major Pain Points: {pp['visual_disappointment']:.0f}% visual disappointment, {pp['price_concerns']:.0f}% price concerns
+        3. Usage Paradox: Higher income (${usage['avg_income_by_usage'].get('occasional', 0):,.0f}) = Less frequent use
+        4. Value Confusion: Despite {rec_rate:.0f}% recommendation rate, unclear value proposition
         
         STRATEGIC RECOMMENDATION
         -----------------------
-        Pivot from "{self.analysis_results['recommendations']['positioning']['from']}" 
-        to "{self.analysis_results['recommendations']['positioning']['to']}"
+        Pivot from "{rec['positioning']['from']}" 
+        to "{rec['positioning']['to']}"
         
-        Target Price: {self.analysis_results['recommendations']['pricing']['to']}
+        Target Price: {rec['pricing']['to']}
         Primary Benefit: Social currency and conversation value
         
         IMPLEMENTATION PRIORITIES
@@ -481,12 +714,12 @@ class BlueSaltAnalysis:
         - Gift purchase rate >30%
         """
         
-        # Save report
-        with open('blue_salt_analysis_report.txt', 'w') as f:
+        # Save report in a single buffered write
+        with open('blue_salt_analysis_report.txt', 'w', buffering=-1) as f:
             f.write(report)
         
-        print(report)
-        print("\n✓ Full report saved as 'blue_salt_analysis_report.txt'")
+        self._emit(report)
+        self._emit("\n✓ Full report saved as 'blue_salt_analysis_report.txt'")
         
         return report
 
@@ -502,13 +735,10 @@ def main():
     4. Visualization
     5. Report generation
     """
-    print("\n" + "="*60)
-    print("BLUE SALT CUSTOMER JOURNEY ANALYSIS")
-    print("Cornell Executive MBA - Marketing Strategy")
-    print("="*60)
+    print(f"\n{_BANNER}\nBLUE SALT CUSTOMER JOURNEY ANALYSIS\nCornell Executive MBA - Marketing Strategy\n{_BANNER}")
     
     # Initialize analysis
-    analyzer = BlueSaltAnalysis()
+    analyzer = BlueSaltAnalysis(verbose=True)
     
     # Execute analysis pipeline
     try:
@@ -531,9 +761,7 @@ def main():
         # Generate final report
         report = analyzer.generate_report()
         
-        print("\n" + "="*60)
-        print("ANALYSIS COMPLETE!")
-        print("="*60)
+        print(_section("ANALYSIS COMPLETE!"))
         print("Generated files:")
         print("  - blue_salt_analysis_dashboard.png")
         print("  - customer_journey_satisfaction.png")
@@ -553,5 +781,12 @@ if __name__ == "__main__":
     
     # Optional: Export processed data for further analysis
     if analyzer and analyzer.clean_data is not None:
-        analyzer.clean_data.to_csv('blue_salt_clean_data.csv', index=False)
-        print("\n✓ Clean data exported to 'blue_salt_clean_data.csv'")
+        # Parquet keeps the categorical/integer dtypes on round-trip
+        analyzer.clean_data.to_parquet(
+            'blue_salt_clean_data.parquet', engine='pyarrow',
+            compression='zstd', compression_level=3,
+            use_dictionary=True, row_group_size=64
+        )
+        with open('blue_salt_clean_data.schema.json', 'w') as f:
+            json.dump(analyzer.clean_data.dtypes.astype(str).to_dict(), f, indent=2)
+        print("\n✓ Clean data exported to 'blue_salt_clean_data.parquet'")